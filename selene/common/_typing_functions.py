@@ -58,6 +58,10 @@ class _SupportsNameForEntity(Protocol):
 
 
 class Query(Generic[E, R]):
+    # queries and commands are called on each step of a test,
+    # so we keep their layout fixed and attribute access fast
+    __slots__ = ('_name', '_fn')
+
     def __init__(
         self,
         name: str | Callable[[E | None], str],
@@ -215,4 +219,4 @@ class Query(Generic[E, R]):
 # TODO: should we change it to Query[E, None | Any]?
 #       so it will be easier to define inline conditions where lambda returns not None
 class Command(Query[E, None]):
-    pass
+    __slots__ = ()
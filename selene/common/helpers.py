@@ -19,6 +19,7 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
+import re
 from typing import Union, Tuple, Iterable, Any
 
 from selenium.webdriver.common.by import By
@@ -81,15 +82,12 @@ def on_error_return_false(no_args_predicate):
         return False
 
 
+_ABSOLUTE_URL_PREFIX = re.compile(r'(?:https?|file|about|data):', re.IGNORECASE)
+
+
 def is_absolute_url(relative_or_absolute_url: str) -> bool:
-    url = relative_or_absolute_url.lower()
-    return (
-        url.startswith('http:')
-        or url.startswith('https:')
-        or url.startswith('file:')
-        or url.startswith('about:')
-        or url.startswith('data:')
-    )
+    # matched in place, without building a lowercased copy of the whole url
+    return _ABSOLUTE_URL_PREFIX.match(relative_or_absolute_url) is not None
 
 
 _HTML_TAGS = [
@@ -116,6 +116,9 @@ from selenium.webdriver import ActionChains, Keys
 # To define current platform:
 import sys
 
+# OS-based modifier key, resolved once on import:
+_COMMAND_KEY = Keys.COMMAND if sys.platform == 'darwin' else Keys.CONTROL
+
 
 # Here goes an actual custom command implementation...
 # We prefix command with underscore by marking it as "not for actual use",
@@ -140,8 +143,6 @@ def _select_all_and_copy(
 
     '''
 
-    _COMMAND_KEY = Keys.COMMAND if sys.platform == 'darwin' else Keys.CONTROL
-
     actions = ActionChains(entity.config.driver)
 
     # select all
@@ -263,8 +264,9 @@ def press_sequentially(keys: str):
     def action(element: Element):
         actions = ActionChains(element.config.driver)
 
+        actions.click(element.locate())
         for key in keys:
-            actions.send_keys_to_element(element.locate(), Keys.END + key)
+            actions.send_keys(Keys.END + key)
 
         actions.perform()
 
@@ -282,34 +284,76 @@ see the actual implementation of Selene's advanced commands in this module.
 # The actual list of commands ↙️
 """
 from __future__ import annotations
+import functools
 import sys
 import warnings
 
-import pyperclip
-from typing_extensions import Union, Optional, overload, cast, Literal
+from typing_extensions import (
+    Union,
+    Optional,
+    Callable,
+    overload,
+    cast,
+    Literal,
+    TypeIs,
+    Dict,
+    Tuple,
+    Any,
+)
 
 from selenium.webdriver import Keys
-from selenium.webdriver.support import expected_conditions
-from selenium.webdriver.support.wait import WebDriverWait
 
-from selene.common import fp
-from selene.core import entity, Collection
+from selene.core import Collection
+from selene.core.entity import _is_element, _wraps_driver
 from selene.core._element import Element
 from selene.core._browser import Browser
 from selene.core.exceptions import _SeleneError
 from selene.common._typing_functions import Command
 from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver import ActionChains
 from selenium.webdriver.common.actions import interaction
 from selenium.webdriver.common.actions.action_builder import ActionBuilder
 from selenium.webdriver.common.actions.pointer_input import PointerInput
 
 
+_IS_MAC = sys.platform == 'darwin'
+_MODIFIER_KEY = Keys.COMMAND if _IS_MAC else Keys.CONTROL
+_MODIFIER_NAME = 'Command' if _IS_MAC else 'Control'
+
+
+def _send_modifier_shortcut(driver: WebDriver, *letters: str, located=None):
+    """Sends OS-based «modifier + letter» shortcut for each letter
+    in one W3C actions request.
+
+    Unlike ActionChains, the request contains only keyboard actions,
+    without empty pointer pauses for each key,
+    unless the located element is passed to be focused by click first.
+    """
+    actions = ActionBuilder(driver)
+    keys = actions.key_action
+
+    if located is not None:
+        actions.pointer_action.click(located)
+        # key pauses for the click ticks: move, down, up
+        keys.pause().pause().pause()
+
+    for letter in letters:
+        keys.key_down(_MODIFIER_KEY).key_down(letter).key_up(letter)
+        keys.key_up(_MODIFIER_KEY)
+
+    actions.perform()
+
+
 class __SaveScreenshot(Command[Browser]):
     """A class to build a expected condition to be used in waits or assertions"""
 
+    __slots__ = ('_default_command',)
+
     def __init__(self):
         self._name = 'save screenshot'
+        # the command without path is the same for all calls, so built once
+        self._default_command = self._build(None)
 
     # if somebody applies a condition as `condition`
     @overload
@@ -320,19 +364,28 @@ class __SaveScreenshot(Command[Browser]):
     def __call__(self, path: Optional[str] = None, /) -> Command[Browser]: ...
 
     def __call__(self, browser_or_path: Browser | Optional[str] = None, /):
-        path: str | None = browser_or_path if isinstance(browser_or_path, str) else None
-        command: Command[Browser] = Command(
-            str(self) + (f' to: {path}' if path is not None else ''),
+        if browser_or_path is None:
+            return self._default_command
+
+        if isinstance(browser_or_path, str):
+            return self._build(browser_or_path)
+
+        if _wraps_driver(browser_or_path):
+            return self._call(cast(Browser, browser_or_path))
+
+        return self._default_command
+
+    def _build(self, path: Optional[str] = None, /) -> Command[Browser]:
+        return Command(
+            self._name  # type: ignore[operator]
+            + (f' to: {path}' if path is not None else ''),
             lambda browser: browser.config._save_screenshot_strategy(
                 browser.config, path
             ),
         )
 
-        if entity._wraps_driver(browser_or_path):
-            command.__call__(cast(Browser, browser_or_path))
-            return None
-
-        return command
+    def _call(self, browser: Browser, /) -> None:
+        self._default_command.__call__(browser)
 
 
 save_screenshot = __SaveScreenshot()
@@ -341,8 +394,12 @@ save_screenshot = __SaveScreenshot()
 class __SavePageSource(Command[Browser]):
     """A class to build a expected condition to be used in waits or assertions"""
 
+    __slots__ = ('_default_command',)
+
     def __init__(self):
         self._name = 'save page source'
+        # the command without path is the same for all calls, so built once
+        self._default_command = self._build(None)
 
     # if somebody applies a condition as `condition`
     @overload
@@ -353,42 +410,44 @@ class __SavePageSource(Command[Browser]):
     def __call__(self, path: Optional[str] = None, /) -> Command[Browser]: ...
 
     def __call__(self, browser_or_path: Browser | Optional[str] = None, /):
-        path: str | None = browser_or_path if isinstance(browser_or_path, str) else None
-        command: Command[Browser] = Command(
-            str(self) + (f' to: {path}' if path is not None else ''),
+        if browser_or_path is None:
+            return self._default_command
+
+        if isinstance(browser_or_path, str):
+            return self._build(browser_or_path)
+
+        if _wraps_driver(browser_or_path):
+            return self._call(cast(Browser, browser_or_path))
+
+        return self._default_command
+
+    def _build(self, path: Optional[str] = None, /) -> Command[Browser]:
+        return Command(
+            self._name  # type: ignore[operator]
+            + (f' to: {path}' if path is not None else ''),
             lambda browser: browser.config._save_page_source_strategy(
                 browser.config, path
             ),
         )
 
-        if entity._wraps_driver(browser_or_path):
-            command.__call__(cast(Browser, browser_or_path))
-            return None
-
-        return command
+    def _call(self, browser: Browser, /) -> None:
+        self._default_command.__call__(browser)
 
 
 save_page_source = __SavePageSource()
 
 
 def __select_all_actions(some_entity: Element | Browser):
-    _COMMAND_KEY = Keys.COMMAND if sys.platform == 'darwin' else Keys.CONTROL
-    actions: ActionChains = ActionChains(some_entity.config.driver)
-
-    actions.key_down(_COMMAND_KEY)
-
-    if entity._is_element(some_entity):
+    _send_modifier_shortcut(
+        some_entity.config.driver,
+        'a',
         # for select_all it's ok to click on input field before sending the shortcut
         # probably it's even a good idea to do such click
-        # that's why it's ok for use to call actions.send_keys_to_element
         # (web_element.send_keys does not such click;))
-        actions.send_keys_to_element(some_entity.locate(), 'a')  # type: ignore
-    else:
-        actions.send_keys('a')
-
-    actions.key_up(_COMMAND_KEY)
-
-    actions.perform()
+        located=(
+            some_entity.locate() if _is_element(some_entity) else None  # type: ignore
+        ),
+    )
 
 
 select_all: Command[Element | Browser] = Command(
@@ -411,17 +470,15 @@ def copy_and_paste(text: str):
 
 
 def __copy(some_entity: Element | Browser):
-    _COMMAND_KEY = Keys.COMMAND if sys.platform == 'darwin' else Keys.CONTROL
-
-    if entity._is_element(some_entity):
-        some_entity.locate().send_keys(_COMMAND_KEY, 'c')  # type: ignore
+    if _is_element(some_entity):
+        # element's send_keys is already a single request
+        # that releases the modifier key at the end,
+        # and unlike focusing by click in actions – it keeps the selection,
+        # that is going to be copied
+        some_entity.locate().send_keys(_MODIFIER_KEY, 'c')  # type: ignore
         return
 
-    actions = ActionChains(some_entity.config.driver)
-    actions.key_down(_COMMAND_KEY)
-    actions.send_keys('c')
-    actions.key_up(_COMMAND_KEY)
-    actions.perform()
+    _send_modifier_shortcut(some_entity.config.driver, 'c')
 
 
 # TODO: define name dynamically based on platform
@@ -441,13 +498,40 @@ Does not support mobile context. Not tested with desktop apps.
 """
 
 
+def __select_all_and_copy_actions(some_entity: Element | Browser):
+    _send_modifier_shortcut(
+        some_entity.config.driver,
+        'a',
+        'c',
+        located=(
+            some_entity.locate() if _is_element(some_entity) else None  # type: ignore
+        ),
+    )
+
+
+select_all_and_copy: Command[Element | Browser] = Command(
+    'send «select all» and «copy» keys shortcuts',
+    __select_all_and_copy_actions,
+)
+"""A command to select all text and copy it to clipboard
+via OS-based keys combinations.
+
+Works like `.perform(command.select_all).perform(command.copy)`,
+but sends both shortcuts to the driver in one actions request,
+i.e. in one round-trip instead of two.
+
+You can call command on both Element and Browser entities.
+In case of Element, the element is located only once.
+
+Does not support mobile context. Not tested with desktop apps.
+"""
+
+
 class __Paste(Command[Union[Element, Browser]]):
+    __slots__ = ()
+
     def __init__(self):
-        self._name = lambda _: (
-            'paste via «'
-            + ('Command' if sys.platform == 'darwin' else 'Control')
-            + ' + v» shortcut'
-        )
+        self._name = lambda _: f'paste via «{_MODIFIER_NAME} + v» shortcut'
 
     @overload
     def __call__(self, entity: Union[Element, Browser], /): ...
@@ -456,8 +540,15 @@ class __Paste(Command[Union[Element, Browser]]):
     def __call__(self, text: str, /): ...
 
     def __call__(self, entity_or_text: Union[Element, Browser] | str, /):
-        maybe_text = entity_or_text if isinstance(entity_or_text, str) else None
+        if isinstance(entity_or_text, str):
+            return self._build(entity_or_text)
+
+        return self._call(entity_or_text)
 
+    def _call(self, some_entity: Union[Element, Browser], /) -> None:
+        self._build(None).__call__(some_entity)
+
+    def _build(self, maybe_text: Optional[str], /) -> Command[Union[Element, Browser]]:
         def name_as_either_copy_and_paste_or_just_paste(_):
             return (
                 '' if maybe_text is None else f'copy «{maybe_text}» to clipboard and '
@@ -466,36 +557,30 @@ class __Paste(Command[Union[Element, Browser]]):
         def maybe_copy_to_clipboard():
             if maybe_text is None:
                 return
+
+            # imported on first use only, because pyperclip may probe
+            # for available clipboard mechanisms on import
+            import pyperclip
+
             pyperclip.copy(maybe_text)
 
         def perform_shortcut_based_actions(some_entity: Element | Browser):
-            _COMMAND_KEY = Keys.COMMAND if sys.platform == 'darwin' else Keys.CONTROL
-
-            if entity._is_element(some_entity):
-                some_entity.locate().send_keys(_COMMAND_KEY, 'v')  # type: ignore
+            if _is_element(some_entity):
+                # as for copy – single request, and no click moving the caret
+                some_entity.locate().send_keys(_MODIFIER_KEY, 'v')  # type: ignore
                 return
 
-            actions = ActionChains(some_entity.config.driver)
-            actions.key_down(_COMMAND_KEY)
-            actions.send_keys('v')
-            actions.key_up(_COMMAND_KEY)
-            actions.perform()
+            _send_modifier_shortcut(some_entity.config.driver, 'v')
+
+        def copy_to_clipboard_if_needed_then_paste(some_entity: Element | Browser):
+            maybe_copy_to_clipboard()
+            perform_shortcut_based_actions(some_entity)
 
-        command: Command[Union[Element, Browser]] = Command(
+        return Command(
             name_as_either_copy_and_paste_or_just_paste,
-            lambda entity: fp.perform(
-                maybe_copy_to_clipboard,
-                lambda: perform_shortcut_based_actions(entity),
-            )(),
+            copy_to_clipboard_if_needed_then_paste,
         )
 
-        if not isinstance(entity_or_text, str):
-            # command is being called
-            command.__call__(entity_or_text)
-
-        # command is being built
-        return command
-
 
 paste = __Paste()
 """A command to paste text from clipboard via OS-based keys combination.
@@ -542,14 +627,16 @@ def long_press(duration=1.0):
 
     def action(entity: Element):
         located_element = entity.locate()
-        driver = entity.config.driver
-        actions: ActionChains = ActionChains(driver)
-
-        actions.w3c_actions = ActionBuilder(
-            driver, mouse=PointerInput(interaction.POINTER_TOUCH, 'touch')
+        # the touch pointer can't be shared between calls,
+        # because it stores the actions of its current sequence,
+        # but at least we don't build ActionChains with default devices
+        # just to replace them with the touch one
+        actions = ActionBuilder(
+            entity.config.driver,
+            mouse=PointerInput(interaction.POINTER_TOUCH, 'touch'),
         )
         (
-            actions.w3c_actions.pointer_action.move_to(located_element)
+            actions.pointer_action.move_to(located_element)
             .pointer_down()
             .pause(duration)
             .release()
@@ -558,7 +645,7 @@ def long_press(duration=1.0):
 
     command = Command(f'long press with duration={duration}', action)
 
-    if entity._is_element(duration):
+    if _is_element(duration):
         # somebody passed command as `.perform(command.long_press)`
         # not as `.perform(command.long_press())`
         # TODO: refactor to really allow such use case without conflicts on types
@@ -590,14 +677,26 @@ def press_sequentially(text: str):
     def action(element: Element):
         actions = ActionChains(element.config.driver)
 
+        # focus the element once, i.e. locate it once,
+        # instead of clicking it before each key
+        actions.click(element.locate())
+        # then send keys via keyboard source only,
+        # without adding a pointer pause for each key down and up
+        keyboard = actions.w3c_actions.key_action
         for key in text:
-            actions.send_keys_to_element(element.locate(), Keys.END + key)
+            keyboard.send_keys(Keys.END + key)
 
         actions.perform()
 
     return Command(f'press sequentially: {text}', action)
 
 
+def _locator_of(entity: Union[Element, WebElement]) -> Callable[[], WebElement]:
+    if isinstance(entity, WebElement):
+        return lambda: entity
+    return entity.locate
+
+
 # TODO: consider
 #       .with(ensure_state_changed=True).perform(command.drag_and_drop_to(target))
 #       over
@@ -615,11 +714,13 @@ def press_sequentially(text: str):
 
 # TODO: consider adding offset args like for click: xoffset, yoffset
 def drag_and_drop_to(
-    target: Element, /, *, _assert_location_changed: bool = False
+    target: Union[Element, WebElement], /, *, _assert_location_changed: bool = False
 ) -> Command[Element]:
     """
     Args:
-        target: a destination element to drag and drop to
+        target: a destination element to drag and drop to,
+            can be also an already located webelement,
+            to skip its finding on each command call
         _assert_location_changed: False by default, but if True,
             then will assert that element was dragged to the new location,
             hence forcing a command retry if command was under waiting.
@@ -627,6 +728,8 @@ def drag_and_drop_to(
             it may be renamed or removed completely.
     """
 
+    locate_target = _locator_of(target)
+
     def func(source: Element):
         source_webelement = source.locate()
         source_location = (
@@ -635,9 +738,11 @@ def drag_and_drop_to(
 
         ActionChains(source.config.driver).drag_and_drop(
             source_webelement,
-            target.locate(),
+            locate_target(),
         ).perform()
 
+        # the source is located again on purpose,
+        # because the dropped element may be re-rendered in the new place
         if _assert_location_changed and source_location == source.locate().location:
             raise _SeleneError('Element was not dragged to the new place')
 
@@ -656,8 +761,23 @@ def drag_and_drop_by_offset(x: int, y: int) -> Command[Element]:
     return Command(f'drag and drop by offset: x={x}, y={y}', func)
 
 
+# shared by all commands built from the same script source,
+# e.g. by each js.set_value(text) call, that reuses the same script with new text
+@functools.lru_cache(maxsize=256)
+def _wrap_script_on_self(script_on_self: str) -> str:
+    return f'''
+        let element = arguments[0]
+        let self = arguments[0]
+        return (function(...args) {{
+            {script_on_self}
+        }})(...arguments[1])
+        '''
+
+
 # TODO: should not we make it to work bothon Element and Browser?
 def _execute_script(script_on_self: str, *arguments) -> Command[Element]:
+    script = _wrap_script_on_self(script_on_self)
+
     def func(self: Element):
         """Executes JS script on self as webelement.
 
@@ -691,22 +811,224 @@ def _execute_script(script_on_self: str, *arguments) -> Command[Element]:
         webelement = self.locate()
         # TODO: should we wrap it in wait or not?
         # TODO: should we add additional it and/or its aliases for element?
-        return driver.execute_script(
-            f'''
-                let element = arguments[0]
-                let self = arguments[0]
-                return (function(...args) {{
-                    {script_on_self}
-                }})(...arguments[1])
-            ''',
-            webelement,
-            arguments,
-        )
+        # TODO: consider BiDi script.callFunction over the driver websocket
+        #       once selenium python exposes it with element (shared id) args;
+        #       CDP Runtime.evaluate is not an option: chromium only,
+        #       and would need a DOM.resolveNode request per element anyway
+        return driver.execute_script(script, webelement, arguments)
 
     # TODO: consider printing somehow in name: sript and args
     return Command('execute script', func)
 
 
+def _execute_script_on_each(script_on_element: str) -> Command[Collection]:
+    """Executes JS script on each element of collection in one request,
+    instead of executing script per each element found one by one.
+
+    The script can use `element` and `self` as aliases to the current element.
+    """
+    script = f'''
+        for (let i = 0; i < arguments.length; i++) {{
+            let element = arguments[i]
+            let self = arguments[i]
+            {script_on_element}
+        }}
+    '''
+
+    def func(collection: Collection):
+        collection.config.driver.execute_script(script, *collection.locate())
+
+    return Command('execute script on each', func)
+
+
+def _minify_js(source: str) -> str:
+    # only indentation and empty lines are removed, but not line breaks,
+    # because scripts may rely on them instead of semicolons
+    return '\n'.join(line.strip() for line in source.splitlines() if line.strip())
+
+
+# scripts are built once on import, not on each command call
+_CLICK_JS_MODERN = _minify_js(
+    '''
+const offsetX = arguments[0]
+const offsetY = arguments[1]
+const rect = element.getBoundingClientRect()
+
+element.dispatchEvent(new MouseEvent('click', {
+  view: window,
+  bubbles: true,
+  cancelable: true,
+  clientX: rect.left + rect.width / 2 + offsetX,
+  clientY: rect.top + rect.height / 2 + offsetY
+}))
+'''
+)
+
+_CLICK_JS_LEGACY = _minify_js(
+    '''
+const offsetX = arguments[0]
+const offsetY = arguments[1]
+const rect = element.getBoundingClientRect()
+
+function mouseEvent() {
+  if (typeof (Event) === 'function') {
+    return new MouseEvent('click', {
+      view: window,
+      bubbles: true,
+      cancelable: true,
+      clientX: rect.left + rect.width / 2 + offsetX,
+      clientY: rect.top + rect.height / 2 + offsetY
+    })
+  }
+  else {
+    const event = document.createEvent('MouseEvent')
+    event.initEvent('click', true, true)
+    event.type = 'click'
+    event.view = window
+    event.clientX = rect.left + rect.width / 2 + offsetX
+    event.clientY = rect.top + rect.height / 2 + offsetY
+    return event
+  }
+}
+element.dispatchEvent(mouseEvent())
+'''
+)
+
+_DRAG_DROP_JS = _minify_js(
+    """
+(function() {
+  function createEvent(typeOfEvent) {
+    var event = document.createEvent('CustomEvent');
+    event.initCustomEvent(typeOfEvent, true, true, null);
+    event.dataTransfer = {
+      data: {},
+      setData: function(key, value) {
+        this.data[key] = value;
+      },
+      getData: function(key) {
+        return this.data[key];
+      }
+    };
+    return event;
+  }
+
+  function dispatchEvent(element, event, transferData) {
+    if (transferData !== undefined) {
+      event.dataTransfer = transferData;
+    }
+    if (element.dispatchEvent) {
+      element.dispatchEvent(event);
+    } else if (element.fireEvent) {
+      element.fireEvent("on" + event.type, event);
+    }
+  }
+
+  function dragAndDrop(element, target) {
+    var dragStartEvent = createEvent('dragstart');
+    dispatchEvent(element, dragStartEvent);
+    var dropEvent = createEvent('drop');
+    dispatchEvent(target, dropEvent, dragStartEvent.dataTransfer);
+    var dragEndEvent = createEvent('dragend');
+    dispatchEvent(element, dragEndEvent, dropEvent.dataTransfer);
+  }
+
+  return dragAndDrop(arguments[0], arguments[1]);
+})(...arguments)
+"""
+)
+
+_DROP_FILE_JS = _minify_js(
+    """
+var target = arguments[0],
+offsetX = arguments[1],
+offsetY = arguments[2],
+document = target.ownerDocument || document,
+window = document.defaultView || window;
+
+var input = document.createElement('INPUT');
+input.type = 'file';
+input.style.display = 'none';
+input.onchange = function () {
+  var rect = target.getBoundingClientRect(),
+      x = rect.left + (offsetX || (rect.width >> 1)),
+      y = rect.top + (offsetY || (rect.height >> 1)),
+      dataTransfer = {
+        files: this.files,
+        types: [ 'Files' ],
+      };
+
+  ['dragenter', 'dragover', 'drop'].forEach(function (name) {
+    var evt = document.createEvent('MouseEvent');
+    evt.initMouseEvent(name, !0, !0, window, 0, 0, 0, x, y, !1, !1, !1, !1, 0, null);
+    evt.dataTransfer = dataTransfer;
+    target.dispatchEvent(evt);
+  });
+
+  document.body.removeChild(input);
+};
+document.body.appendChild(input);
+return input;
+"""
+)
+
+_WAIT_FOR_DETACHED_JS = _minify_js(
+    """
+var input = arguments[0],
+    done = arguments[arguments.length - 1];
+if (!input.isConnected) return done();
+new MutationObserver(function (mutations, observer) {
+  if (!input.isConnected) {
+    observer.disconnect();
+    done();
+  }
+}).observe(input.ownerDocument.body, { childList: true });
+"""
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _is_iterable_type(entity_type: type) -> bool:
+    return hasattr(entity_type, '__iter__')
+
+
+def _is_collection_like(entity: Union[Element, Collection]) -> TypeIs[Collection]:
+    # checked once per entity class instead of the attribute lookup per each call
+    # (web and mobile collections do not inherit core Collection, hence no isinstance)
+    return _is_iterable_type(type(entity))
+
+
+def _execute_script_on_element_or_each(
+    script_on_element: str,
+) -> Callable[[Union[Element, Collection]], None]:
+    on_element = _execute_script(script_on_element)
+    on_each = _execute_script_on_each(script_on_element)
+
+    def func(entity: Union[Element, Collection]) -> None:
+        if _is_collection_like(entity):
+            on_each(entity)
+        else:
+            on_element(entity)
+
+    return func
+
+
+@functools.lru_cache(maxsize=512)
+def _set_style_property(name: str, value: str) -> Command[Union[Element, Collection]]:
+    # built once per (name, value) pair, so the same script sources
+    # are reused on each call instead of being formatted again
+    script = f'element.style.{name}="{value}"'
+    return Command(f'set {script}', _execute_script_on_element_or_each(script))
+
+
+class _BrowserScript(Command[Browser]):
+    __slots__ = ('_js_source',)
+
+    def __init__(self, name: str, js_source: str):
+        super().__init__(name, lambda browser: browser.driver.execute_script(js_source))
+        # kept to be joined with other scripts by js.batch
+        self._js_source = js_source
+
+
 class js:  # pylint: disable=invalid-name
     """A container for JavaScript-based commands.
 
@@ -720,23 +1042,27 @@ class js:  # pylint: disable=invalid-name
 
     @staticmethod
     def set_value(value: Union[str, int]) -> Command[Element]:
+        text = str(value)
 
         return Command(
             f'set value by js: {value}',
             _execute_script(
-                """
-                var text = arguments[0];
-                var maxlength = element.getAttribute('maxlength') === null
-                    ? -1
-                    : parseInt(element.getAttribute('maxlength'));
-                element.value = maxlength === -1
-                    ? text
-                    : text.length <= maxlength
+                (
+                    """
+                    var text = arguments[0];
+                    var maxlength = element.getAttribute('maxlength');
+                    maxlength = maxlength === null ? -1 : parseInt(maxlength);
+                    element.value = maxlength === -1 || text.length <= maxlength
                         ? text
                         : text.substring(0, maxlength);
-                return null;
-                """,
-                str(value),
+                    """
+                    if text
+                    # empty text fits any maxlength, so there is nothing to check
+                    else """
+                    element.value = '';
+                    """
+                ),
+                text,
             ),
         )
 
@@ -746,24 +1072,20 @@ class js:  # pylint: disable=invalid-name
             f'set value by js: {keys}',
             _execute_script(
                 """
-                textToAppend = arguments[0];
-                var value = element.value || '';
-                var text = value + textToAppend;
-                var maxlength = element.getAttribute('maxlength') === null
-                    ? -1
-                    : parseInt(element.getAttribute('maxlength'));
-                element.value = maxlength === -1
+                var text = (element.value || '') + arguments[0];
+                var maxlength = element.getAttribute('maxlength');
+                maxlength = maxlength === null ? -1 : parseInt(maxlength);
+                element.value = maxlength === -1 || text.length <= maxlength
                     ? text
-                    : text.length <= maxlength
-                        ? text
-                        : text.substring(0, maxlength);
-                return null;
+                    : text.substring(0, maxlength);
                 """,
                 str(keys),
             ),
         )
 
     class __ScrollIntoView(Command[Element]):
+        __slots__ = ()
+
         def __init__(self):
             self._name = 'scroll into view'
 
@@ -815,8 +1137,16 @@ class js:  # pylint: disable=invalid-name
 
     # TODO: should we process collections too? i.e. click through all elements?
     class __ClickWithOffset(Command[Element]):
-        def __init__(self):
-            self._name = 'click'
+        __slots__ = ('_script', '_default_command', '_commands_by_offset')
+
+        # to not grow forever on clicks with many different offsets
+        _MAX_CACHED_COMMANDS = 256
+
+        def __init__(self, *, _legacy: bool = False):
+            self._name = 'click' if not _legacy else 'legacy click'
+            self._script = _CLICK_JS_MODERN if not _legacy else _CLICK_JS_LEGACY
+            self._commands_by_offset: Dict[Tuple[Any, Any], Command[Element]] = {}
+            self._default_command = self._with_offset(0, 0)
 
         @overload
         def __call__(self, element: Element) -> None: ...
@@ -825,153 +1155,136 @@ class js:  # pylint: disable=invalid-name
         def __call__(self, *, xoffset=0, yoffset=0) -> Command[Element]: ...
 
         def __call__(self, element: Element | None = None, *, xoffset=0, yoffset=0):
-            func = _execute_script(
-                '''
-                    const offsetX = arguments[0]
-                    const offsetY = arguments[1]
-                    const rect = element.getBoundingClientRect()
-
-                    function mouseEvent() {
-                      if (typeof (Event) === 'function') {
-                        return new MouseEvent('click', {
-                          view: window,
-                          bubbles: true,
-                          cancelable: true,
-                          clientX: rect.left + rect.width / 2 + offsetX,
-                          clientY: rect.top + rect.height / 2 + offsetY
-                        })
-                      }
-                      else {
-                        const event = document.createEvent('MouseEvent')
-                        event.initEvent('click', true, true)
-                        event.type = 'click'
-                        event.view = window
-                        event.clientX = rect.left + rect.width / 2 + offsetX
-                        event.clientY = rect.top + rect.height / 2 + offsetY
-                        return event
-                      }
-                    }
-                    element.dispatchEvent(mouseEvent())
-                ''',
-                xoffset,
-                yoffset,
+            command = (
+                self._with_offset(xoffset, yoffset)
+                if xoffset or yoffset
+                else self._default_command
             )
 
             if element is not None:
                 # somebody passed command as `.perform(command.js.click)`
                 # not as `.perform(command.js.click())`
-                func(element)
+                command(element)
                 return None
 
-            return Command(
+            return command
+
+        # so repeated clicks with same offsets reuse the same command
+        def _with_offset(self, xoffset, yoffset) -> Command[Element]:
+            command = self._commands_by_offset.get((xoffset, yoffset))
+            if command is not None:
+                return command
+
+            command = Command(
                 (
                     self.__str__()
                     if (not xoffset and not yoffset)
-                    else f'click(xoffset={xoffset},yoffset={yoffset})'
+                    else f'{self}(xoffset={xoffset},yoffset={yoffset})'
                 ),
-                func,
+                _execute_script(self._script, xoffset, yoffset),
             )
+            if len(self._commands_by_offset) < self._MAX_CACHED_COMMANDS:
+                self._commands_by_offset[(xoffset, yoffset)] = command
+            return command
 
     click = __ClickWithOffset()
+    """Clicks on element via dispatching `new MouseEvent('click', ...)` to it.
+
+    The script has no fallback for browsers without MouseEvent constructor,
+    use `legacy_click` for them (e.g. Internet Explorer or Edge in IE mode).
+    """
+
+    legacy_click = __ClickWithOffset(_legacy=True)
+    """Same as `click`, but also supports browsers without MouseEvent constructor,
+    like Internet Explorer, by falling back to `document.createEvent('MouseEvent')`.
+    """
 
-    clear_local_storage: Command[Browser] = Command(
+    clear_local_storage: Command[Browser] = _BrowserScript(
         'clear local storage',
-        lambda browser: browser.driver.execute_script('window.localStorage.clear()'),
+        'window.localStorage.clear()',
     )
 
-    clear_session_storage: Command[Browser] = Command(
-        'clear local storage',
-        lambda browser: browser.driver.execute_script('window.sessionStorage.clear()'),
+    clear_session_storage: Command[Browser] = _BrowserScript(
+        'clear session storage',
+        'window.sessionStorage.clear()',
     )
 
+    @staticmethod
+    def batch(*commands: Command[Browser]) -> Command[Browser]:
+        """Executes scripts of all given browser commands in one request.
+
+        Only commands backed by a plain script on browser can be batched,
+        like `command.js.clear_local_storage` or another batch.
+
+        Examples:
+
+        ```
+        browser.perform(
+            command.js.batch(
+                command.js.clear_local_storage,
+                command.js.clear_session_storage,
+            )
+        )
+        ```
+        """
+        for command in commands:
+            if not isinstance(command, _BrowserScript):
+                raise TypeError(
+                    f'can batch only commands of browser scripts, but got: {command}'
+                )
+
+        return _BrowserScript(
+            f'batch: {", ".join(str(command) for command in commands)}',
+            ';\n'.join(
+                cast(_BrowserScript, command)._js_source for command in commands
+            ),
+        )
+
     remove: Command[Union[Element, Collection]] = Command(
         'remove',
-        lambda entity: (
-            _execute_script('element.remove()')(entity)
-            if not hasattr(entity, '__iter__')
-            else [_execute_script('element.remove()')(element) for element in entity]
-        )
-        # command should return None anyway:
-        and None
-        or None,  # TODO: should we change Command to return None | Any to avoid this workaround?
+        _execute_script_on_element_or_each('element.remove()'),
     )
 
+    remove_one: Command[Element] = Command(
+        'remove',
+        _execute_script('element.remove()'),
+    )
+    """Same as `remove` but for element only, skipping the check for collection."""
+
+    remove_many: Command[Collection] = Command(
+        'remove',
+        _execute_script_on_each('element.remove()'),
+    )
+    """Same as `remove` but for collection only, skipping the check for collection.
+    All elements are removed in one script request.
+    """
+
     @staticmethod
-    def set_style_property(name: str, value: Union[str, int]) -> Command[Element]:
-        return Command(
-            f'set element.style.{name}="{value}"',
-            lambda entity: (
-                _execute_script(f'element.style.{name}="{value}"')(entity)
-                if not hasattr(entity, '__iter__')
-                else [
-                    _execute_script(f'element.style.{name}="{value}"')(element)
-                    for element in entity
-                ]
-            )
-            and None
-            or None,
-        )
+    def set_style_property(
+        name: str, value: Union[str, int]
+    ) -> Command[Union[Element, Collection]]:
+        return _set_style_property(name, str(value))
 
-    set_style_display_to_none: Command[Union[Element, Collection]] = Command(
-        'set element.style.display="none"',
-        lambda entity: (
-            _execute_script('element.style.display="none"')(entity)
-            if not hasattr(entity, '__iter__')
-            else [
-                _execute_script('element.style.display="none"')(element)
-                for element in entity
-            ]
-        )
-        and None
-        or None,
+    set_style_display_to_none: Command[Union[Element, Collection]] = (
+        _set_style_property('display', 'none')
     )
 
-    set_style_display_to_block: Command[Union[Element, Collection]] = Command(
-        'set element.style.display="block"',
-        lambda entity: (
-            _execute_script('element.style.display="block"')(entity)
-            if not hasattr(entity, '__iter__')
-            else [
-                _execute_script('element.style.display="block"')(element)
-                for element in entity
-            ]
-        )
-        and None
-        or None,
+    set_style_display_to_block: Command[Union[Element, Collection]] = (
+        _set_style_property('display', 'block')
     )
 
-    set_style_visibility_to_hidden: Command[Union[Element, Collection]] = Command(
-        'set element.style.visibility="hidden"',
-        lambda entity: (
-            _execute_script('element.style.visibility="hidden"')(entity)
-            if not hasattr(entity, '__iter__')
-            else [
-                _execute_script('element.style.visibility="hidden"')(element)
-                for element in entity
-            ]
-        )
-        and None
-        or None,
+    set_style_visibility_to_hidden: Command[Union[Element, Collection]] = (
+        _set_style_property('visibility', 'hidden')
     )
 
-    set_style_visibility_to_visible: Command[Union[Element, Collection]] = Command(
-        'set element.style.visibility="visible"',
-        lambda entity: (
-            _execute_script('element.style.visibility="visible"')(entity)
-            if not hasattr(entity, '__iter__')
-            else [
-                _execute_script('element.style.visibility="visible"')(element)
-                for element in entity
-            ]
-        )
-        and None
-        or None,
+    set_style_visibility_to_visible: Command[Union[Element, Collection]] = (
+        _set_style_property('visibility', 'visible')
     )
 
     # TODO: add js.drag_and_drop_by_offset(x, y)
 
     @staticmethod
-    def drag_and_drop_to(target: Element) -> Command[Element]:
+    def drag_and_drop_to(target: Union[Element, WebElement]) -> Command[Element]:
         """
         Simulates drag and drop via JavaScript.
 
@@ -980,53 +1293,22 @@ class js:  # pylint: disable=invalid-name
             May not work everywhere. Among known cases:
             does not work on [Material UI React Continuous Slider](https://mui.com/material-ui/react-slider/#ContinuousSlider)
             where the normal drag and drop works fine.
+
+        Both source and target are located on each command call,
+        and then all drag and drop events are dispatched in one script request.
+        If the same target is used for many drags,
+        and it is not going to be re-rendered in between,
+        consider passing it as `target.cached` to skip its re-finding,
+        e.g. `card.perform(command.js.drag_and_drop_to(slot.cached))`,
+        or pass already located webelement, e.g. `slot.locate()`.
         """
+        locate_target = _locator_of(target)
 
         def func(source: Element):
-            script = """
-            (function() {
-              function createEvent(typeOfEvent) {
-                var event = document.createEvent('CustomEvent');
-                event.initCustomEvent(typeOfEvent, true, true, null);
-                event.dataTransfer = {
-                  data: {},
-                  setData: function(key, value) {
-                    this.data[key] = value;
-                  },
-                  getData: function(key) {
-                    return this.data[key];
-                  }
-                };
-                return event;
-              }
-
-              function dispatchEvent(element, event, transferData) {
-                if (transferData !== undefined) {
-                  event.dataTransfer = transferData;
-                }
-                if (element.dispatchEvent) {
-                  element.dispatchEvent(event);
-                } else if (element.fireEvent) {
-                  element.fireEvent("on" + event.type, event);
-                }
-              }
-
-              function dragAndDrop(element, target) {
-                var dragStartEvent = createEvent('dragstart');
-                dispatchEvent(element, dragStartEvent);
-                var dropEvent = createEvent('drop');
-                dispatchEvent(target, dropEvent, dragStartEvent.dataTransfer);
-                var dragEndEvent = createEvent('dragend');
-                dispatchEvent(element, dragEndEvent, dropEvent.dataTransfer);
-              }
-
-              return dragAndDrop(arguments[0], arguments[1]);
-            })(...arguments)
-            """.strip()
             source.config.driver.execute_script(
-                script,
+                _DRAG_DROP_JS,
                 source.locate(),
-                target.locate(),
+                locate_target(),
             )
 
         return Command(f'drag and drop to: {target}', func)
@@ -1051,48 +1333,22 @@ class js:  # pylint: disable=invalid-name
         yoffset = 0
 
         def func(source: Element):
-            script = """
-            var target = arguments[0],
-            offsetX = arguments[1],
-            offsetY = arguments[2],
-            document = target.ownerDocument || document,
-            window = document.defaultView || window;
-
-            var input = document.createElement('INPUT');
-            input.type = 'file';
-            input.style.display = 'none';
-            input.onchange = function () {
-              var rect = target.getBoundingClientRect(),
-                  x = rect.left + (offsetX || (rect.width >> 1)),
-                  y = rect.top + (offsetY || (rect.height >> 1)),
-                  dataTransfer = {
-                    files: this.files,
-                    types: [ 'Files' ],
-                  };
-
-              ['dragenter', 'dragover', 'drop'].forEach(function (name) {
-                var evt = document.createEvent('MouseEvent');
-                evt.initMouseEvent(name, !0, !0, window, 0, 0, 0, x, y, !1, !1, !1, !1, 0, null);
-                evt.dataTransfer = dataTransfer;
-                target.dispatchEvent(evt);
-              });
-
-              setTimeout(function () { document.body.removeChild(input); }, 25);
-            };
-            document.body.appendChild(input);
-            return input;
-            """.strip()
-
             temp_input = source.config.driver.execute_script(
-                script,
+                _DROP_FILE_JS,
                 source.locate(),
                 xoffset,
                 yoffset,
             )
             temp_input.send_keys(path)
 
-            WebDriverWait(source.config.driver, 50).until(
-                expected_conditions.staleness_of(temp_input)
+            # waits for the input to be removed on drop by DOM mutation event,
+            # instead of polling for its staleness from the client side;
+            # usually it's already removed, because the change event is fired
+            # during sending keys, but if its handler failed, the input stays,
+            # and the wait fails on driver's script timeout
+            source.config.driver.execute_async_script(
+                _WAIT_FOR_DETACHED_JS,
+                temp_input,
             )
 
         return Command(f'drop file: {path}', func)
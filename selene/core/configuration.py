@@ -23,6 +23,8 @@
 from __future__ import annotations
 
 import atexit
+import dataclasses
+import functools
 import inspect
 import itertools
 import os
@@ -44,14 +46,17 @@ from typing_extensions import (
     Tuple,
 )
 
+from selenium.webdriver import Chrome, Firefox, Edge, Remote
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.firefox.service import Service as FirefoxService
+from selenium.webdriver.edge.service import Service as EdgeService  # type: ignore
 from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.webdriver.common.options import BaseOptions
+from selenium.webdriver.common.options import ArgOptions, BaseOptions
 from selenium.webdriver.common.service import Service
 
 from selene.common import fp, helpers
 from selene.common.data_structures import persistent
 from selene.common.fp import F
-from selene.common.helpers import on_error_return_false
 
 from selene.core.exceptions import TimeoutException
 
@@ -60,176 +65,203 @@ from selene.core.wait import Wait
 E = TypeVar('E')
 
 
-# TODO: consider moving to support.*
-#       like support._logging.wait_with
-def _build_local_driver_by_name_or_remote_by_url_and_options(
-    config: Config,
-) -> WebDriver:
-    from selenium.webdriver import (
-        ChromeOptions,
-        EdgeOptions,
-        Chrome,
-        Firefox,
-        Edge,
+def _build_chrome_driver(config: Config) -> WebDriver:
+    return Chrome(
+        service=config.driver_service or ChromeService(),
+        options=config.driver_options,
     )
 
-    from selenium.webdriver.chrome.service import Service as ChromeService
-    from selenium.webdriver.firefox.service import Service as FirefoxService
-    from selenium.webdriver.edge.service import Service as EdgeService  # type: ignore
 
-    def build_chrome():
-        return Chrome(
-            service=config.driver_service or ChromeService(),
-            options=config.driver_options,
-        )
+def _build_firefox_driver(config: Config) -> WebDriver:
+    return Firefox(
+        service=config.driver_service or FirefoxService(),
+        options=config.driver_options,
+    )
 
-    def build_firefox():
-        return Firefox(
-            service=config.driver_service or FirefoxService(),
-            options=config.driver_options,
-        )
 
-    def build_edge():
-        return Edge(
-            service=config.driver_service or EdgeService(),
-            options=config.driver_options,
-        )
+def _build_edge_driver(config: Config) -> WebDriver:
+    return Edge(
+        service=config.driver_service or EdgeService(),
+        options=config.driver_options,
+    )
+
+
+class _AttachedRemote(Remote):
+    """A remote driver attached to already started session
+    instead of starting a new one."""
 
-    def build_remote_driver():
-        from selenium.webdriver import Remote
+    def __init__(self, session_id: str, **kwargs):
+        self._session_id_to_attach = session_id
+        super().__init__(**kwargs)
 
-        # TODO: consider guessing browserstack remote url
-        #       if noticed 'bstack:options' in config.driver_options
+    def start_session(self, capabilities: dict) -> None:
+        self.session_id = self._session_id_to_attach
+        # W3C has no command to get capabilities of existing session,
+        # so they are taken from the options the session was started with
+        self.caps = dict(capabilities)
 
-        return Remote(
+
+def _build_remote_driver(config: Config) -> WebDriver:
+    # TODO: consider guessing browserstack remote url
+    #       if noticed 'bstack:options' in config.driver_options
+
+    if config.driver_session_id:
+        return _AttachedRemote(
+            config.driver_session_id,
             command_executor=config.driver_remote_url,
-            options=config.driver_options,
+            # options give capabilities of attached driver, like browserName
+            options=config.driver_options or ArgOptions(),
         )
 
-    def build_appium_driver():
-        try:
-            from appium import webdriver
-        except ImportError as error:
-            raise ImportError(
-                'Appium-Python-Client is not installed, '
-                'run `pip install Appium-Python-Client`,'
-                'or add and install dependency '
-                'with your favorite dependency manager like poetry: '
-                '`poetry add Appium-Python-Client`'
-            ) from error
-
-        # TODO: consider to add more smart guessing of options if not set...
-        #       like if driver_name is set to 'appium'
-        #       and driver_options is not set
-        #       and the base_url is set to url of some web app
-        #       then build appium driver options
-        #       to run web test on mobile browser
-        #       else if base_url is set to app path or url,
-        #       parse app type and build corresponding appium driver options
-        #       ...
-        #       TODO: should we even rename base_url to app_url
-        #             to cover both web and mobile? or just app?
-        #             what about keeping both?
-        #             but allowing to set only one of them at same moment?
-
-        return webdriver.Remote(
-            command_executor=(
-                config.driver_remote_url
-                if config.driver_remote_url
-                else 'http://127.0.0.1:4723/wd/hub'
-            ),
-            options=config.driver_options,
-        )
+    return Remote(
+        command_executor=config.driver_remote_url,
+        options=config.driver_options,
+    )
 
-    return {  # type: ignore
-        'chrome': build_chrome,
-        'firefox': build_firefox,
-        'edge': build_edge,
-        'remote': build_remote_driver,
-        'appium': build_appium_driver,
-    }.get(
-        'appium'
-        if (
-            config.driver_name == 'appium'
-            or (
-                config.driver_options
-                and 'platformName' in config.driver_options.capabilities
-                and config.driver_options.capabilities['platformName'].lower()
-                in ['android', 'ios']
-            )
-        )
-        else (
-            'remote'
-            if (config.driver_remote_url or config.driver_name == 'remote')
-            # TODO: consider automatically detect installed browser if driver_name not set
-            else (
-                config.driver_name
-                if config.driver_name
-                else (
-                    config.driver_options.capabilities['browserName']
-                    if (
-                        config.driver_options
-                        and 'browserName' in config.driver_options.capabilities
-                    )  # TODO: add one more check based on config.driver_service
-                    else 'chrome'
-                )
-            )
-        )
-    )()
 
+def _build_appium_driver(config: Config) -> WebDriver:
+    try:
+        from appium import webdriver
+    except ImportError as error:
+        raise ImportError(
+            'Appium-Python-Client is not installed, '
+            'run `pip install Appium-Python-Client`,'
+            'or add and install dependency '
+            'with your favorite dependency manager like poetry: '
+            '`poetry add Appium-Python-Client`'
+        ) from error
+
+    # TODO: consider to add more smart guessing of options if not set...
+    #       like if driver_name is set to 'appium'
+    #       and driver_options is not set
+    #       and the base_url is set to url of some web app
+    #       then build appium driver options
+    #       to run web test on mobile browser
+    #       else if base_url is set to app path or url,
+    #       parse app type and build corresponding appium driver options
+    #       ...
+    #       TODO: should we even rename base_url to app_url
+    #             to cover both web and mobile? or just app?
+    #             what about keeping both?
+    #             but allowing to set only one of them at same moment?
+
+    return webdriver.Remote(
+        command_executor=(
+            config.driver_remote_url
+            if config.driver_remote_url
+            else 'http://127.0.0.1:4723/wd/hub'
+        ),
+        options=config.driver_options,
+    )
 
-def _maybe_reset_driver_then_tune_window_and_get_with_base_url(config: Config):
-    def get(url: Optional[str] = None) -> None:
-        if (
-            config._reset_not_alive_driver_on_get_url
-            and config._executor.is_driver_set
-            and config._executor.is_driver_managed
-            and not config._executor.is_driver_alive
-        ):
-            # TODO: consider logging this reset
-            #       so user will see it and decide to disable it
-            config.driver = typing.cast(WebDriver, ...)
-
-        driver = config.driver
-
-        relative_or_absolute_url = url
-        if relative_or_absolute_url is None:
-            # force to init driver and open browser or app (for mobile)
-            # _ = config.driver  # TODO: why not doing this in all cases?
-            if not config.base_url:
-                # do nothing more
-                return
-            if not config._get_base_url_on_open_with_no_args:
-                # yet do nothing more
-                return
-            # proceed with adjusted relative url
-            # to be concatenated with base url
-            relative_or_absolute_url = ''
-
-        # TODO: skip for mobile
-        width = config.window_width
-        height = config.window_height
-
-        if width or height:
-            if not (width and height):
-                size = driver.get_window_size()
-                width = width or size['width']
-                height = height or size['height']
-
-            driver.set_window_size(int(width), int(height))
-
-        is_absolute = helpers.is_absolute_url(relative_or_absolute_url)
-        base_url = config.base_url
-        url = (
-            relative_or_absolute_url
-            if is_absolute
-            else base_url + relative_or_absolute_url
+
+_DRIVER_BUILDERS: typing.Mapping[str, Callable[[Config], WebDriver]] = MappingProxyType(
+    {
+        'chrome': _build_chrome_driver,
+        'firefox': _build_firefox_driver,
+        'edge': _build_edge_driver,
+        # browserName of EdgeOptions, in lower case
+        'microsoftedge': _build_edge_driver,
+        'remote': _build_remote_driver,
+        'appium': _build_appium_driver,
+    }
+)
+
+
+_MOBILE_PLATFORMS = frozenset(('android', 'ios'))
+
+
+def _resolve_driver_name(config: Config) -> str:
+    # normalized to match keys of _DRIVER_BUILDERS, like 'chrome' for 'Chrome'
+    driver_name = (config.driver_name or '').lower()
+    if driver_name == 'appium':
+        return 'appium'
+
+    options = config.driver_options
+    capabilities = options.capabilities if options else {}
+    if (capabilities.get('platformName') or '').lower() in _MOBILE_PLATFORMS:
+        return 'appium'
+
+    if config.driver_remote_url or driver_name == 'remote':
+        return 'remote'
+
+    # TODO: consider automatically detect installed browser if driver_name not set
+    if driver_name:
+        return driver_name
+
+    # TODO: add one more check based on config.driver_service
+    return (capabilities.get('browserName') or 'chrome').lower()
+
+
+# TODO: consider moving to support.*
+#       like support._logging.wait_with
+def _build_local_driver_by_name_or_remote_by_url_and_options(
+    config: Config,
+) -> WebDriver:
+    driver_name = _resolve_driver_name(config)
+    if config.driver_session_id and driver_name != 'remote':
+        warnings.warn(
+            f'config.driver_session_id is ignored when building {driver_name} driver, '
+            'it is used only for remote driver, i.e. with config.driver_remote_url set',
+            UserWarning,
         )
+    return _DRIVER_BUILDERS[driver_name](config)
+
+
+def _maybe_reset_driver_then_tune_window_and_get_url(
+    config: Config, url: Optional[str] = None
+) -> None:
+    if (
+        config._reset_not_alive_driver_on_get_url
+        and config._executor.is_driver_set
+        and config._executor.is_driver_managed
+        and not config._executor.is_driver_alive
+    ):
+        # TODO: consider logging this reset
+        #       so user will see it and decide to disable it
+        config.driver = ...  # type: ignore[assignment]
+
+    driver = config.driver
+
+    relative_or_absolute_url = url
+    if relative_or_absolute_url is None:
+        # force to init driver and open browser or app (for mobile)
+        # _ = config.driver  # TODO: why not doing this in all cases?
+        if not config.base_url:
+            # do nothing more
+            return
+        if not config._get_base_url_on_open_with_no_args:
+            # yet do nothing more
+            return
+        # proceed with adjusted relative url
+        # to be concatenated with base url
+        relative_or_absolute_url = ''
+
+    # TODO: skip for mobile
+    width = config.window_width
+    height = config.window_height
+
+    if width or height:
+        if not (width and height):
+            size = driver.get_window_size()
+            width = width or size['width']
+            height = height or size['height']
+
+        driver.set_window_size(int(width), int(height))
+
+    is_absolute = helpers.is_absolute_url(relative_or_absolute_url)
+    base_url = config.base_url
+    url = (
+        relative_or_absolute_url if is_absolute else base_url + relative_or_absolute_url
+    )
 
-        # TODO: should we wrap it into wait? at least for logging?
-        driver.get(url)
+    # TODO: should we wrap it into wait? at least for logging?
+    driver.get(url)
 
-    return get
+
+def _maybe_reset_driver_then_tune_window_and_get_with_base_url(config: Config):
+    # partial is cheap to build, so the strategy can be called on each get url
+    return functools.partial(_maybe_reset_driver_then_tune_window_and_get_url, config)
 
 
 # TODO: should we do a complete Manager from it, not just executor,
@@ -238,10 +270,18 @@ def _maybe_reset_driver_then_tune_window_and_get_with_base_url(config: Config):
 class _DriverStrategiesExecutor:
     def __init__(self, config: Config):
         self.config = config
+        self._driver_box: Optional[persistent.Box] = None
 
     @property
     def driver_instance(self) -> typing.Union[Optional[WebDriver], ...]:  # type: ignore
-        return persistent.Field.value_from(self.config, 'driver')
+        # the box is set once on config init and then only its value changes,
+        # so it is safe to keep the reference to it, once it is got
+        box = self._driver_box
+        if box is None:
+            box = self._driver_box = getattr(
+                self.config, persistent.Field.box_mask('driver')
+            )
+        return box.value
 
     @property
     def is_driver_managed(self) -> bool:
@@ -299,29 +339,37 @@ class _ManagedDriverDescriptor:
         if instance is None:
             return self
 
-        config = typing.cast(Config, instance)
+        config: Config = instance
         # Below...
         # we can't access driver via config.driver explicitly
         # or implicitly by calling other config.* methods,
         # because it will lead to recursion!!!
 
-        driver_box = typing.cast(persistent.Box[WebDriver], getattr(config, self.name))
+        # the box is read directly from instance dict, bypassing getattr,
+        # because driver is accessed on each command and its waiting attempt
+        driver_box: persistent.Box[WebDriver] = config.__dict__[self.name]
+        value = driver_box.value
+
+        # fast path for the most common case of already built driver
+        if isinstance(value, WebDriver) and not config.rebuild_not_alive_driver:
+            return value
+
         if (
-            driver_box.value is None
-            or driver_box.value is ...
+            value is None
+            or value is ...
             or (
                 # TODO: think on: if turned on, may slow down tests...
                 #       especially when running remote tests...
                 config.rebuild_not_alive_driver
-                and not callable(driver_box.value)  # TODO: consider deprecating
-                and not config._is_driver_alive_strategy(driver_box.value)
+                and not callable(value)  # TODO: consider deprecating
+                and not config._is_driver_alive_strategy(value)
             )
         ):
             driver = config.build_driver_strategy(config)
             driver_box.value = driver
             config._schedule_driver_teardown_strategy(config, lambda: driver)
+            value = driver
 
-        value = driver_box.value
         if callable(value):
             # warnings.warn(
             #     'Providing driver as callable might be deprecated in future. '
@@ -334,7 +382,7 @@ class _ManagedDriverDescriptor:
         return value
 
     def __set__(self, instance, value):
-        config = typing.cast(Config, instance)
+        config: Config = instance
 
         if not hasattr(instance, self.name):
             # setting this attribute for the first time,
@@ -382,16 +430,126 @@ class _ManagedDriverDescriptor:
         else:
             # setting WebDriver instance after init
             driver_box = getattr(instance, self.name)
+            if driver_box.value is value:
+                # the teardown of this driver is already scheduled,
+                # no need to add one more atexit handler
+                return
             driver_box.value = value
 
             # currently passing driver as callable disables driver teardown
             if not callable(value):
-                # TODO: should not we check value set above,
-                #       wasn't the same as was in driver_box.value before?
-                #       if yes, we might not want to add one more atexit handler
                 config._schedule_driver_teardown_strategy(config, lambda: value)
 
 
+def _is_driver_alive(driver: WebDriver) -> bool:
+    service = getattr(driver, 'service', None)
+    if service is not None:
+        process = service.process
+        return process is not None and process.poll() is None
+
+    try:
+        # driver.title is not None – would work too
+        return driver.window_handles is not None
+    except Exception:
+        return False
+
+
+def _quit_driver_if_set_and_alive_unless_held(
+    config: Config,
+) -> Callable[[WebDriver], None]:
+    def teardown(driver: WebDriver) -> None:
+        if config.hold_driver_at_exit:
+            return
+        if not config._is_driver_set_strategy(driver):
+            return
+        if not config._is_driver_alive_strategy(driver):
+            return
+
+        driver.quit()
+
+    return teardown
+
+
+def _save_screenshot(config: Config, path: Optional[str] = None) -> Optional[str]:
+    if path is None:
+        # generated file name has proper extension and its folder is already created
+        path = config._generate_filename(suffix='.png')
+    else:
+        if not path.lower().endswith('.png'):
+            if path:
+                path = os.path.join(path, f'{next(config._counter)}.png')
+            else:
+                warnings.warn(
+                    'name used for saved screenshot does not match file '
+                    'type. It should end with an `.png` extension',
+                    UserWarning,
+                )
+
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+
+    saved_path = path if config.driver.get_screenshot_as_file(path) else None
+
+    config.last_screenshot = saved_path
+    return saved_path
+
+
+def _save_page_source(config: Config, path: Optional[str] = None) -> Optional[str]:
+    if path is None:
+        # generated file name has proper extension and its folder is already created
+        path = config._generate_filename(suffix='.html')
+    else:
+        if not path.lower().endswith('.html'):
+            if path:
+                path = os.path.join(path, f'{next(config._counter)}.html')
+            else:
+                warnings.warn(
+                    'name used for saved page source does not match file '
+                    'type. It should end with an `.html` extension',
+                    UserWarning,
+                )
+
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+
+    # written as bytes to skip newline translation of possibly huge page source
+    source = config.driver.page_source.encode('utf-8')
+    try:
+        with open(path, 'wb') as file:
+            file.write(source)
+    except OSError:
+        pass
+
+    config.last_page_source = path
+    return path
+
+
+# returns the same function object on each wait,
+# instead of building a new `lambda f: f` per each waited command
+def _no_wait_decorator(wait: Wait[E]) -> Callable[[F], F]:
+    return fp.identity
+
+
+# fields are known on class definition, so can be collected once per config class
+@functools.lru_cache(maxsize=None)
+def _driver_like_options_of(config_class: type) -> typing.FrozenSet[str]:
+    return frozenset(
+        field.name
+        for field in dataclasses.fields(config_class)
+        if 'driver' in field.name
+    )
+
+
+# read-only, so can be safely shared as default by all configs
+_EMPTY_PLACEHOLDERS: typing.Mapping[str, Any] = MappingProxyType({})
+
+_IS_WINDOWS = os.name == 'nt'
+
+_XPATH_PREFIXES = ('/', './', '..', '(', '*/')
+
+
 @persistent.dataclass
 class Config:
     """
@@ -691,13 +849,7 @@ class Config:
 
     # TODO: since it's curried, shouldn't we rename it driver_teardown_strategy?
     _teardown_driver_strategy: Callable[[Config], Callable[[WebDriver], None]] = (
-        lambda config: lambda driver: (
-            driver.quit()
-            if not config.hold_driver_at_exit
-            and config._is_driver_set_strategy(driver)
-            and config._is_driver_alive_strategy(driver)
-            else None
-        )
+        _quit_driver_if_set_and_alive_unless_held
     )
     """Defines how driver will be teardown.
 
@@ -715,12 +867,7 @@ class Config:
     """
 
     # TODO: should we make it private so far?
-    _is_driver_alive_strategy: Callable[[WebDriver], bool] = lambda driver: (
-        # on_error_return_false(lambda: driver.title is not None)
-        (driver.service.process is not None and driver.service.process.poll() is None)
-        if hasattr(driver, 'service')
-        else on_error_return_false(lambda: driver.window_handles is not None)
-    )
+    _is_driver_alive_strategy: Callable[[WebDriver], bool] = _is_driver_alive
     """Defines the logic of checking driver for being alive.
 
     Is supposed to be used in context of triggering automatic driver rebuild,
@@ -773,6 +920,38 @@ class Config:
     Currently we name it and type hint as URL,
     but if you pass a RemoteConnection object,
     it will work same way as in Selenium WebDriver.
+
+    The RemoteConnection built from the URL by default `config.build_driver_strategy`
+    uses HTTP keep-alive (Selenium's default), i.e. reuses TCP/TLS connection
+    for all driver commands of the session – that matters a lot for remote grids
+    like BrowserStack, where reconnecting on each command may slow down
+    tests significantly. If you need to tune the connection further,
+    pass your own RemoteConnection object here.
+    """
+
+    driver_session_id: Optional[str] = None
+    """An id of already started remote session to attach to,
+    instead of starting a new one, when building driver
+    by default `config.build_driver_strategy`.
+
+    Is used only for remote Selenium driver, i.e. if `config.driver_remote_url`
+    is set too, and is ignored (with a warning) for local and Appium drivers.
+
+    Since the session is not started, the capabilities of the attached driver
+    (like `driver.name`) are taken from `config.driver_options`,
+    so set them to the same options the session was started with.
+    Might be useful during local development to reuse the same browser
+    between test runs, saving time on browser startup:
+
+    ```python
+    browser.config.driver_remote_url = 'http://127.0.0.1:4444'
+    browser.config.driver_options = ChromeOptions()
+    browser.config.driver_session_id = 'id of session started before'
+    browser.config.hold_driver_at_exit = True
+    ```
+
+    Consider also setting `config.hold_driver_at_exit` to True,
+    to keep the session alive for the next run.
     """
 
     # TODO: consider typing as Optional[Literal['chrome', 'firefox', 'edge', 'appium']]
@@ -900,6 +1079,7 @@ class Config:
             'is not relevant to mobile context. '
             'Use `config.hold_driver_at_exit` instead',
             DeprecationWarning,
+            stacklevel=2,
         )
         return self.hold_driver_at_exit
 
@@ -910,6 +1090,7 @@ class Config:
             'is not relevant to mobile context. '
             'Use `config.hold_driver_at_exit = ...` instead',
             DeprecationWarning,
+            stacklevel=2,
         )
         self.hold_driver_at_exit = value
 
@@ -969,7 +1150,9 @@ class Config:
     # _executor: _DriverStrategiesExecutor = typing.cast(_DriverStrategiesExecutor, ...)
     # def __post_init__(self):
     #     self._executor = _DriverStrategiesExecutor(self)
-    @property
+    # built once per config on first access,
+    # while configs copied via config.with_(...) get their own executor
+    @functools.cached_property
     def _executor(self):
         return _DriverStrategiesExecutor(self)
 
@@ -1190,7 +1373,7 @@ class Config:
     #       > _placeholders_for_list_globs_to_match
     _placeholders_to_match_elements: Dict[
         Literal['zero_or_one', 'exactly_one', 'one_or_more', 'zero_or_more'], Any
-    ] = cast(dict, MappingProxyType({}))
+    ] = cast(dict, _EMPTY_PLACEHOLDERS)
     """A dict of default placeholders to be used among values passed to Selene
     collection conditions like `have._texts_like(*values)`. Such values then can
     be considered as a list globbing pattern, where a defined placeholder will
@@ -1242,13 +1425,7 @@ class Config:
     #       https://github.com/microsoft/playwright/releases/tag/v1.27.0
     selector_to_by_strategy: Callable[[str], Tuple[str, str]] = lambda selector: (
         (By.XPATH, selector)
-        if (
-            selector.startswith('/')
-            or selector.startswith('./')
-            or selector.startswith('..')
-            or selector.startswith('(')
-            or selector.startswith('*/')
-        )
+        if selector.startswith(_XPATH_PREFIXES)
         else (By.CSS_SELECTOR, selector)
     )
     """A strategy to convert a selector string to a Selenium By type of selector,
@@ -1314,7 +1491,7 @@ class Config:
     # maybe better time to decide on this will be once we have more such options :p
     # TODO: What about config.wait_decorator_strategy?
     #       or even config.build_wait_decorator_strategy?
-    _wait_decorator: Callable[[Wait[E]], Callable[[F], F]] = lambda w: lambda f: f
+    _wait_decorator: Callable[[Wait[E]], Callable[[F], F]] = _no_wait_decorator
     """Is used when performing any element command and assertion (i.e. should)
     Hence, can be used to log corresponding commands with waits,
     and integrate with something like allure reporting;)
@@ -1366,7 +1543,7 @@ class Config:
         os.path.expanduser('~'),
         '.selene',
         'screenshots',
-        str(round(time.time() * 1000)),
+        str(time.time_ns() // 1_000_000),
     )
     """A folder to save screenshots and page sources on failure."""
     save_screenshot_on_failure: bool = True
@@ -1378,7 +1555,7 @@ class Config:
     If saved, will be also logged to the console on failure.
     """
     # TODO: consider making public
-    _counter: itertools.count = itertools.count(start=int(round(time.time() * 1000)))
+    _counter: itertools.count = itertools.count(start=time.time_ns() // 1_000_000)
     """A counter, currently used for incrementing screenshot and page source names"""
     last_screenshot: Optional[str] = None
     last_page_source: Optional[str] = None
@@ -1386,47 +1563,7 @@ class Config:
     #       maybe yes, because we yet accept config in it...
     #       so we expect it to be a Strategy of some bigger Context
     # TODO: why the return type is Any? shouldn't it be a string of path?
-    _save_screenshot_strategy: Callable[[Config, Optional[str]], Any] = (
-        lambda config, path=None: fp.thread(  # type: ignore
-            path,
-            lambda path: (
-                config._generate_filename(suffix='.png') if path is None else path
-            ),
-            lambda path: (
-                os.path.join(path, f'{next(config._counter)}.png')
-                if path and not path.lower().endswith('.png')
-                else path
-            ),
-            fp.do(
-                fp.pipe(  # type: ignore
-                    os.path.dirname,
-                    lambda folder: (
-                        os.makedirs(folder)
-                        if folder and not os.path.exists(folder)
-                        else ...
-                    ),
-                )
-            ),
-            fp.do(
-                lambda path: (
-                    warnings.warn(
-                        'name used for saved screenshot does not match file '
-                        'type. It should end with an `.png` extension',
-                        UserWarning,
-                    )
-                    if not path.lower().endswith('.png')
-                    else ...
-                )
-            ),
-            lambda path: (path if config.driver.get_screenshot_as_file(path) else None),
-            fp.do(
-                lambda path: setattr(config, 'last_screenshot', path)
-            ),  # On refactor>rename, we may miss it here :( better would be like:
-            #  setattr(config, config.__class__.last_screenshot.name, path)
-            #  but currently .name will return '__boxed_last_screenshot' :(
-            #  think on how we can resolve this...
-        )
-    )
+    _save_screenshot_strategy: Callable[[Config, Optional[str]], Any] = _save_screenshot
     """Defines a strategy for saving a screenshot.
 
     The default strategy saves a screenshot to a file,
@@ -1434,47 +1571,7 @@ class Config:
     """
 
     _save_page_source_strategy: Callable[[Config, Optional[str]], Any] = (
-        lambda config, path=None: fp.thread(  # type: ignore
-            path,
-            lambda path: (
-                config._generate_filename(suffix='.html') if path is None else path
-            ),
-            lambda path: (
-                os.path.join(path, f'{next(config._counter)}.html')
-                if path and not path.lower().endswith('.html')
-                else path
-            ),
-            fp.do(
-                fp.pipe(  # type: ignore
-                    os.path.dirname,
-                    lambda folder: (
-                        os.makedirs(folder)
-                        if folder and not os.path.exists(folder)
-                        else ...
-                    ),
-                )
-            ),
-            fp.do(
-                lambda path: (
-                    warnings.warn(
-                        'name used for saved page source does not match file '
-                        'type. It should end with an `.html` extension',
-                        UserWarning,
-                    )
-                    if not path.lower().endswith('.html')
-                    else ...
-                )
-            ),
-            lambda path: (path, config.driver.page_source),
-            fp.do(lambda path_and_source: fp.write_silently(*path_and_source)),
-            lambda path_and_source: path_and_source[0],
-            fp.do(
-                lambda path: setattr(config, 'last_page_source', path)
-            ),  # On refactor>rename, we may miss it here :( better would be like:
-            #  setattr(config, config.__class__.last_screenshot.name, path)
-            #  but currently .name will return '__boxed_last_screenshot' :(
-            #  think on how we can resolve this...
-        )
+        _save_page_source
     )
     """Defines a strategy for saving a page source on failure.
 
@@ -1534,7 +1631,9 @@ class Config:
             if (
                 self._override_driver_with_all_driver_like_options
                 and 'driver' not in options_to_override
-                and any('driver' in key for key in options_to_override)
+                and not options_to_override.keys().isdisjoint(
+                    _driver_like_options_of(type(self))
+                )
             )
             else options_to_override
         )
@@ -1543,29 +1642,37 @@ class Config:
     # TODO: should we make it and similar – true private over protected?
     def _format_path_as_uri(self, path):
         """Converts a local file path to a URI that can be clicked in most editors and browsers."""
-        prefix = 'file://'
-        if os.name == 'nt':  # Windows specific
+        if _IS_WINDOWS:
             # Replace backslashes with forward slashes and prepend with 'file://'
-            return f"{prefix}{path.replace(os.sep, '/')}"
-        else:
-            # Unix-based paths
-            return f"{prefix}{path}"
+            return f"file://{path.replace(os.sep, '/')}"
+        # Unix-based paths
+        return f"file://{path}"
 
     def _generate_filename(self, prefix='', suffix=''):
-        path = self.reports_folder
-        next_id = next(self._counter)
-        filename = f'{prefix}{next_id}{suffix}'
-        file = os.path.join(path, f'{filename}')
+        file = os.path.join(
+            self.reports_folder, f'{prefix}{next(self._counter)}{suffix}'
+        )
 
         folder = os.path.dirname(file)
-        if not os.path.exists(folder) and folder:
-            os.makedirs(folder)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
 
         return file
 
     # TODO: consider moving this injection to the WaitingEntity.wait method
     #       to build Wait object instead of config.wait
     def _inject_screenshot_and_page_source_pre_hooks(self, hook):
+        # is called on each wait build, i.e. on each command,
+        # so hooks are composed once per config and hook_wait_failure;
+        # hook is compared by identity, because it may be unhashable
+        cached = self.__dict__.get('_composed_failure_hook')
+        if cached is not None and cached[0] is hook:
+            return cached[1]
+        composed = self._compose_screenshot_and_page_source_pre_hooks(hook)
+        self.__dict__['_composed_failure_hook'] = (hook, composed)
+        return composed
+
+    def _compose_screenshot_and_page_source_pre_hooks(self, hook):
         # TODO: consider moving hooks to class methods accepting config as argument
         #       or refactor somehow to eliminate all times defining hook fns
         def save_and_log_screenshot(error: TimeoutException) -> Exception:
@@ -1575,9 +1682,11 @@ class Config:
             #       should become monad-friendly,
             #       with some kind of .map/.bind under the hood
             #       and propagating error to the end if happened
-            path, maybe_failure = fp._either(
-                self._save_screenshot_strategy, or_=WebDriverException
-            )(self)
+            try:
+                path = self._save_screenshot_strategy(self)
+                maybe_failure = None
+            except WebDriverException as failure:
+                path, maybe_failure = None, failure
             return TimeoutException(
                 error.msg
                 # todo: should we just skip logging screenshot at all when failure?
@@ -1602,9 +1711,11 @@ class Config:
                 else self._generate_filename(suffix='.html')
             )
 
-            path, maybe_failure = fp._either(
-                self._save_page_source_strategy, or_=WebDriverException
-            )(self, filename)
+            try:
+                path = self._save_page_source_strategy(self, filename)
+                maybe_failure = None
+            except WebDriverException as failure:
+                path, maybe_failure = None, failure
             return TimeoutException(
                 error.msg
                 + '\nPageSource: '
@@ -1618,11 +1729,14 @@ class Config:
                 )
             )
 
-        return fp.pipe(
-            save_and_log_screenshot if self.save_screenshot_on_failure else None,
-            save_and_log_page_source if self.save_page_source_on_failure else None,
-            hook,
-        )
+        def save_and_log_artifacts_then_hook(error: TimeoutException) -> Exception:
+            if self.save_screenshot_on_failure:
+                error = save_and_log_screenshot(error)
+            if self.save_page_source_on_failure:
+                error = save_and_log_page_source(error)
+            return hook(error) if hook else error
+
+        return save_and_log_artifacts_then_hook
 
     # TODO: maybe here wait_factory would be better name?
     #       yes, it's also a strategy, but completely not connected with other
@@ -60,6 +60,7 @@ class Browser(_WaitingConfiguredEntity):
         driver_options: Optional[BaseOptions] = None,
         driver_service: Optional[Service] = None,
         driver_remote_url: Optional[str] = None,
+        driver_session_id: Optional[str] = None,
         hold_driver_at_exit: bool = False,
         _reset_not_alive_driver_on_get_url: bool = True,
         rebuild_not_alive_driver: bool = False,
@@ -12,8 +12,12 @@ from tests.helpers import headless_chrome_options
 
 
 @pytest.fixture(scope='session')
-def chrome_driver(request):
-    dotenv = dotenv_values()
+def dotenv():
+    return dotenv_values()
+
+
+@pytest.fixture(scope='session')
+def chrome_driver(request, dotenv):
     headless = (
         str(request.config.getoption('--headless', dotenv.get('headless'))).lower()
         == 'true'
@@ -29,8 +33,8 @@ def chrome_driver(request):
     chrome_driver.quit()
 
 
-@pytest.fixture(scope='function')
-def a_remote_browser():
+@pytest.fixture(scope='session')
+def remote_chrome_options():
     options = webdriver.ChromeOptions()
     options.browser_version = '125.0'
     options.set_capability(
@@ -42,12 +46,16 @@ def a_remote_browser():
             'enableLog': True,
         },
     )
-    project_config = dotenv_values()
+    return options
+
+
+@pytest.fixture(scope='function')
+def a_remote_browser(dotenv, remote_chrome_options):
     browser_ = Browser(
         Config(
-            driver_options=options,
+            driver_options=remote_chrome_options,
             driver_remote_url=(
-                f'https://{project_config["LOGIN"]}:{project_config["PASSWORD"]}@'
+                f'https://{dotenv["LOGIN"]}:{dotenv["PASSWORD"]}@'
                 f'{const.SELENOID_HOST}/wd/hub'
             ),
         )
@@ -59,30 +67,16 @@ def a_remote_browser():
 
 
 @pytest.fixture(scope='module')
-def the_module_remote_browser():
-    dotenv = dotenv_values()
-
+def the_module_remote_browser(dotenv, remote_chrome_options):
     class ProjectConfig:
         selenoid_login = os.getenv('selenoid_login', dotenv.get('selenoid_login'))
         selenoid_password = os.getenv(
             'selenoid_password', dotenv.get('selenoid_password')
         )
 
-    options = webdriver.ChromeOptions()
-    options.browser_version = '125.0'
-    options.set_capability(
-        'selenoid:options',
-        {
-            'screenResolution': '1920x1080x24',
-            'enableVNC': True,
-            'enableVideo': True,
-            'enableLog': True,
-        },
-    )
-
     browser_ = Browser(
         Config(
-            driver_options=options,
+            driver_options=remote_chrome_options,
             driver_remote_url=(
                 f'https://{ProjectConfig.selenoid_login}:'
                 f'{ProjectConfig.selenoid_password}@'
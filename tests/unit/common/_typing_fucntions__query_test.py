@@ -3,7 +3,7 @@ from __future__ import annotations
 import pytest
 
 from selene.core.exceptions import ConditionMismatch
-from selene.common._typing_functions import Query
+from selene.common._typing_functions import Query, Command
 
 
 def test_query_name_and_application():
@@ -35,3 +35,12 @@ def test_query_recomposition():
     assert 'is increment positive' == str(is_increment_positive)
     assert is_increment_positive(0) is True
     assert is_increment_positive(-1) is False
+
+
+def test_command_has_no_instance_dict():
+    ...
+
+    increment = Command('increment', lambda x: None)
+
+    assert not hasattr(increment, '__dict__')
+    assert 'increment' == str(increment)
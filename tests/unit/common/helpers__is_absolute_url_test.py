@@ -0,0 +1,22 @@
+import pytest
+
+from selene.common.helpers import is_absolute_url
+
+
+@pytest.mark.parametrize(
+    'url',
+    [
+        'http://example.com',
+        'HTTPS://example.com/path',
+        'file:///tmp/index.html',
+        'about:blank',
+        'data:text/html,<p>hi</p>',
+    ],
+)
+def test_is_absolute_url__for_supported_schemes(url):
+    assert is_absolute_url(url)
+
+
+@pytest.mark.parametrize('url', ['', '/path', 'path/to', '?q=http:', 'httpx://a'])
+def test_is_absolute_url__is_false_for_relative(url):
+    assert not is_absolute_url(url)
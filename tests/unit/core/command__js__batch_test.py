@@ -0,0 +1,19 @@
+import pytest
+
+from selene import command
+
+
+def test_command_js_batch__joins_names_of_browser_script_commands():
+    batch = command.js.batch(
+        command.js.clear_local_storage,
+        command.js.clear_session_storage,
+    )
+
+    assert str(batch) == 'batch: clear local storage, clear session storage'
+
+
+def test_command_js_batch__fails_on_not_a_browser_script_command():
+    with pytest.raises(TypeError) as error:
+        command.js.batch(command.js.clear_local_storage, command.js.remove)
+
+    assert 'remove' in str(error.value)
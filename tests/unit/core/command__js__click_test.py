@@ -7,3 +7,11 @@ def test_command_js_click__is_a_command_on_element_instance():
 
     assert Command in inspect.getmro(command.js.click.__class__)
     # TODO: what else can we check? How can we check that it is Command[Element]?
+
+
+def test_command_js_click__is_reused_for_same_offsets():
+
+    assert command.js.click(xoffset=5, yoffset=10) is command.js.click(
+        xoffset=5, yoffset=10
+    )
+    assert command.js.click() is not command.js.legacy_click()
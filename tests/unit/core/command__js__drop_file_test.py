@@ -0,0 +1,56 @@
+import pytest
+from selenium.common import TimeoutException
+
+from selene import command
+
+
+class FakeInput:
+    def __init__(self):
+        self.sent_keys = []
+
+    def send_keys(self, *keys):
+        self.sent_keys.extend(keys)
+
+
+class FakeDriver:
+    def __init__(self, *, input_removed=True):
+        self.input = FakeInput()
+        self.input_removed = input_removed
+        self.awaited = []
+
+    def execute_script(self, script, *args):
+        return self.input
+
+    def execute_async_script(self, script, *args):
+        self.awaited.append(args)
+        if not self.input_removed:
+            raise TimeoutException('script timeout')
+
+
+class FakeConfig:
+    def __init__(self, driver):
+        self.driver = driver
+
+
+class FakeElement:
+    def __init__(self, driver):
+        self.config = FakeConfig(driver)
+
+    def locate(self):
+        return 'webelement'
+
+
+def test_command_js_drop_file__waits_for_temp_input_removal_after_sending_path():
+    driver = FakeDriver()
+
+    command.js.drop_file('/tmp/file.txt')(FakeElement(driver))
+
+    assert driver.input.sent_keys == ['/tmp/file.txt']
+    assert driver.awaited == [(driver.input,)]
+
+
+def test_command_js_drop_file__fails_if_temp_input_was_not_removed():
+    driver = FakeDriver(input_removed=False)
+
+    with pytest.raises(TimeoutException):
+        command.js.drop_file('/tmp/file.txt')(FakeElement(driver))
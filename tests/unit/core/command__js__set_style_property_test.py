@@ -0,0 +1,11 @@
+from selene import command
+
+
+def test_command_js_set_style_property__is_reused_for_same_name_and_value():
+    display_none = command.js.set_style_property('display', 'none')
+
+    assert command.js.set_style_property('display', 'none') is display_none
+    assert command.js.set_style_property('zIndex', 1) is (
+        command.js.set_style_property('zIndex', '1')
+    )
+    assert str(display_none) == 'set element.style.display="none"'
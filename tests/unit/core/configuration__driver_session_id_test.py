@@ -0,0 +1,45 @@
+import warnings
+
+import pytest
+from selenium.webdriver import ChromeOptions
+
+from selene.core.configuration import (
+    Config,
+    _build_local_driver_by_name_or_remote_by_url_and_options,
+    _build_remote_driver,
+)
+
+
+def test_build_remote_driver__attaches_to_session_if_id_set():
+    config = Config(
+        driver_remote_url='http://127.0.0.1:4444',
+        driver_session_id='abc',
+        hold_driver_at_exit=True,
+    )
+
+    driver = _build_remote_driver(config)
+
+    assert driver.session_id == 'abc'
+
+
+def test_build_driver__warns_that_session_id_is_ignored_for_not_remote_driver():
+    config = Config(driver_name='appium', driver_session_id='abc')
+
+    with warnings.catch_warnings():
+        # to fail before actually building the driver
+        warnings.simplefilter('error', UserWarning)
+        with pytest.raises(UserWarning, match='driver_session_id is ignored'):
+            _build_local_driver_by_name_or_remote_by_url_and_options(config)
+
+
+def test_build_remote_driver__takes_capabilities_of_attached_driver_from_options():
+    config = Config(
+        driver_remote_url='http://127.0.0.1:4444',
+        driver_options=ChromeOptions(),
+        driver_session_id='abc',
+        hold_driver_at_exit=True,
+    )
+
+    driver = _build_remote_driver(config)
+
+    assert driver.name == 'chrome'
@@ -0,0 +1,77 @@
+from selene.core.configuration import Config
+
+
+class FakeDriver:
+    pass
+
+
+def test_config_driver__rebuilds_driver_quit_right_after_access():
+    driver = FakeDriver()
+    new_driver = FakeDriver()
+    quit_drivers = []
+    config = Config(
+        driver=driver,
+        hold_driver_at_exit=True,
+        rebuild_not_alive_driver=True,
+        _is_driver_alive_strategy=lambda it: it not in quit_drivers,
+        build_driver_strategy=lambda _: new_driver,
+    )
+    assert config.driver is driver
+
+    quit_drivers.append(driver)
+
+    assert config.driver is new_driver
+
+
+def test_config_driver__rebuilds_not_alive_driver():
+    driver = FakeDriver()
+    new_driver = FakeDriver()
+    config = Config(
+        driver=driver,
+        hold_driver_at_exit=True,
+        rebuild_not_alive_driver=True,
+        _is_driver_alive_strategy=lambda it: it is not driver,
+        build_driver_strategy=lambda _: new_driver,
+    )
+
+    assert config.driver is new_driver
+    assert config.driver is new_driver
+
+
+def test_config_driver__schedules_teardown_once_when_same_driver_set_again():
+    scheduled = []
+    config = Config(
+        driver=...,
+        _schedule_driver_teardown_strategy=lambda _, get_driver: scheduled.append(
+            get_driver()
+        ),
+    )
+    driver = FakeDriver()
+
+    config.driver = driver
+    config.driver = driver
+
+    assert scheduled.count(driver) == 1
+
+
+def test_config_with__builds_new_driver_when_driver_like_option_overridden():
+    driver = FakeDriver()
+    new_driver = FakeDriver()
+    config = Config(
+        driver=driver,
+        hold_driver_at_exit=True,
+        build_driver_strategy=lambda _: new_driver,
+    )
+
+    assert config.with_(timeout=1.0).driver is driver
+    assert config.with_(driver_name='firefox').driver is new_driver
+    assert config.with_(hold_driver_at_exit=True).driver is new_driver
+
+
+def test_config_executor__can_be_built_before_driver_is_set():
+    config = object.__new__(Config)
+
+    executor = config._executor
+    config.__init__(driver=FakeDriver(), hold_driver_at_exit=True)
+
+    assert executor.driver_instance is config.driver
@@ -0,0 +1,45 @@
+import dataclasses
+
+from selene.core.configuration import Config
+from selene.core.exceptions import TimeoutException
+
+
+def test_inject_screenshot_and_page_source_pre_hooks__composes_once_per_hook():
+    config = Config()
+
+    def hook(error):
+        return error
+
+    assert config._inject_screenshot_and_page_source_pre_hooks(
+        hook
+    ) is config._inject_screenshot_and_page_source_pre_hooks(hook)
+
+
+def test_inject_screenshot_and_page_source_pre_hooks__respects_later_changed_flags():
+    config = Config()
+    hook_failure = config._inject_screenshot_and_page_source_pre_hooks(None)
+    config.save_screenshot_on_failure = False
+    config.save_page_source_on_failure = False
+    error = TimeoutException('failed')
+
+    assert hook_failure(error) is error
+
+
+def test_inject_screenshot_and_page_source_pre_hooks__accepts_unhashable_hook():
+    @dataclasses.dataclass
+    class Hook:
+        calls: int = 0
+
+        def __call__(self, error):
+            self.calls += 1
+            return error
+
+    hook = Hook()
+    config = Config(save_screenshot_on_failure=False, save_page_source_on_failure=False)
+    error = TimeoutException('failed')
+
+    hook_failure = config._inject_screenshot_and_page_source_pre_hooks(hook)
+
+    assert hook_failure is config._inject_screenshot_and_page_source_pre_hooks(hook)
+    assert hook_failure(error) is error
+    assert hook.calls == 1
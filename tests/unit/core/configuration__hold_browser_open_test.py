@@ -0,0 +1,15 @@
+import pytest
+
+from selene.core.configuration import Config
+
+
+def test_hold_browser_open__warns_as_deprecated_on_each_access():
+    config = Config()
+
+    for _ in range(2):
+        with pytest.warns(DeprecationWarning) as records:
+            config.hold_browser_open = True
+            assert config.hold_browser_open is True
+
+        assert len(records) == 2
+        assert all(record.filename == __file__ for record in records)
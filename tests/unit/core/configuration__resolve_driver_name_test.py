@@ -0,0 +1,47 @@
+from selenium.webdriver import EdgeOptions, FirefoxOptions
+from selenium.webdriver.common.options import ArgOptions
+
+from selene.core.configuration import Config, _DRIVER_BUILDERS, _resolve_driver_name
+
+
+def test_resolve_driver_name__is_chrome_by_default():
+    assert _resolve_driver_name(Config()) == 'chrome'
+
+
+def test_resolve_driver_name__prefers_explicit_name_over_options():
+    assert (
+        _resolve_driver_name(
+            Config(driver_name='edge', driver_options=FirefoxOptions())
+        )
+        == 'edge'
+    )
+
+
+def test_resolve_driver_name__is_browser_name_from_options():
+    assert _resolve_driver_name(Config(driver_options=FirefoxOptions())) == 'firefox'
+
+
+def test_resolve_driver_name__is_remote_if_remote_url_set():
+    assert (
+        _resolve_driver_name(
+            Config(driver_name='firefox', driver_remote_url='http://127.0.0.1:4444')
+        )
+        == 'remote'
+    )
+
+
+def test_resolve_driver_name__is_appium_for_mobile_platform_in_options():
+    options = ArgOptions()
+    options.set_capability('platformName', 'Android')
+
+    assert _resolve_driver_name(Config(driver_options=options)) == 'appium'
+
+
+def test_resolve_driver_name__is_lower_case_of_explicit_name():
+    assert _resolve_driver_name(Config(driver_name='Firefox')) == 'firefox'
+
+
+def test_resolve_driver_name__is_buildable_for_edge_options():
+    assert (
+        _resolve_driver_name(Config(driver_options=EdgeOptions())) in _DRIVER_BUILDERS
+    )
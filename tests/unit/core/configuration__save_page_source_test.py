@@ -0,0 +1,22 @@
+import os
+import shutil
+
+from selene.core.configuration import Config, _save_page_source
+
+
+class FakeDriver:
+    page_source = '<html></html>'
+
+
+def test_save_page_source__recreates_removed_reports_folder(tmp_path):
+    config = Config(
+        driver=FakeDriver(),
+        hold_driver_at_exit=True,
+        reports_folder=str(tmp_path / 'reports'),
+    )
+    _save_page_source(config)
+    shutil.rmtree(config.reports_folder)
+
+    path = _save_page_source(config)
+
+    assert os.path.isfile(path)